@@ -1,75 +1,240 @@
 #!/usr/bin/env python3
 """
 Verify SuperClaude installation from different Python environments
+
+Usage: verify-superclaude.py [--first-only [--no-cache]]
+  --first-only  Stop at the first Python with SuperClaude and print it
+  --no-cache    Probe live instead of reusing cached --first-only results
+
+When SUPERCLAUDE_PYTHON is set, --first-only accepts it without probing
+any other candidate.
+
+--first-only reuses earlier successful probes from CACHE_FILE. A package
+broken inside site-packages can still be reported as found until the cache
+is bypassed with --no-cache. The full report always probes live.
 """
 import sys
 import os
+import json
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+_HOME = os.path.expanduser("~")
+_CWD = os.getcwd()
+
+# Successful --first-only probes are remembered here
+CACHE_FILE = os.path.join(_HOME, ".cache", "superclaude-enterprise", "python.json")
+_cache_lock = threading.Lock()
 
-def check_superclaude(python_path, env_name):
-    """Check if SuperClaude is available in given Python"""
+# Single probe that reports import status and details in one interpreter run
+PROBE_SCRIPT = (
+    'import json, sys\n'
+    'try:\n'
+    '    import SuperClaude\n'
+    '    print(json.dumps({"ok": True, "exe": sys.executable, "file": SuperClaude.__file__}))\n'
+    'except Exception as e:\n'
+    '    print(json.dumps({"ok": False, "err": str(e)}))\n'
+)
+PROBE_ARGS = ('-c', PROBE_SCRIPT)
+
+def resolve_python(python_path):
+    """Return the absolute path of an executable Python, or None if missing"""
+    # abspath rather than realpath: a venv python is a symlink to the base binary
+    resolved = shutil.which(python_path)
+    return os.path.abspath(resolved) if resolved else None
+
+def _is_current_python(resolved):
+    """True if resolved is this interpreter and sees the same sys.path as a -c probe"""
+    return resolved == os.path.abspath(sys.executable) \
+        and os.path.abspath(sys.path[0]) == _CWD
+
+def probe_superclaude(resolved):
+    """Run the probe in given resolved Python and return its result as a dict"""
+    if not resolved:
+        return {"ok": False, "missing": True}
+    
+    # The current interpreter can answer in-process without spawning itself
+    if _is_current_python(resolved):
+        try:
+            import SuperClaude
+            return {"ok": True, "exe": sys.executable, "file": SuperClaude.__file__}
+        except Exception as e:
+            return {"ok": False, "err": str(e)}
+    
     try:
         result = subprocess.run(
-            [python_path, '-c', 'import SuperClaude; print("OK")'],
+            (resolved,) + PROBE_ARGS,
             capture_output=True,
-            text=True
+            text=True,
+            timeout=5
         )
-        
-        if result.returncode == 0 and "OK" in result.stdout:
-            print(f"✅ {env_name}: SuperClaude found")
-            
-            # Get more details
-            details = subprocess.run(
-                [python_path, '-c', 
-                 'import SuperClaude; import sys; '
-                 'print(f"  Python: {sys.executable}"); '
-                 'print(f"  Module: {SuperClaude.__file__}")'],
-                capture_output=True,
-                text=True
-            )
-            if details.returncode == 0:
-                print(details.stdout.strip())
-            return True
-        else:
-            print(f"❌ {env_name}: SuperClaude NOT found")
-            if result.stderr:
-                print(f"   Error: {result.stderr.strip()}")
-            return False
     except FileNotFoundError:
-        print(f"❌ {env_name}: Python not found at {python_path}")
-        return False
+        return {"ok": False, "missing": True}
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "err": f"Timed out probing {resolved}"}
     except Exception as e:
-        print(f"❌ {env_name}: Error - {e}")
-        return False
+        return {"ok": False, "err": str(e)}
+    
+    try:
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"ok": False, "err": result.stderr.strip()}
 
-print("=== SuperClaude Installation Verification ===\n")
+def _read_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _cached_info(entry, mtime, pythonpath, cwd):
+    """Return the cached probe result if entry is still valid, else None"""
+    try:
+        if entry["mtime"] != mtime or entry["pythonpath"] != pythonpath \
+                or entry["cwd"] != cwd:
+            return None
+        info = entry["info"]
+        if info["ok"] is True and isinstance(info["file"], str) \
+                and os.path.exists(info["file"]):
+            return info
+    except (KeyError, TypeError):
+        pass
+    return None
+
+@lru_cache(maxsize=None)
+def probe_cached(resolved):
+    """Probe given resolved Python, reusing a cached success if it is unchanged"""
+    if not resolved or _is_current_python(resolved):
+        return probe_superclaude(resolved)
+    mtime = os.stat(resolved).st_mtime
+    pythonpath = os.environ.get("PYTHONPATH", "")
+    cwd = _CWD
+    
+    with _cache_lock:
+        cached = _cached_info(_read_cache().get(resolved), mtime, pythonpath, cwd)
+    if cached:
+        return cached
+    
+    info = probe_superclaude(resolved)
+    # A namespace package has no __file__ to revalidate later
+    if info.get("ok") and isinstance(info.get("file"), str):
+        with _cache_lock:
+            data = _read_cache()
+            data[resolved] = {"mtime": mtime, "pythonpath": pythonpath, "cwd": cwd, "info": info}
+            try:
+                os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+                with open(CACHE_FILE, "w") as f:
+                    json.dump(data, f, indent=2)
+            except OSError:
+                pass
+    return info
+
+def format_superclaude(info, python_path, env_name):
+    """Return the report lines for given Python's probe result"""
+    if info.get("ok"):
+        return [
+            f"✅ {env_name}: SuperClaude found",
+            f"  Python: {info['exe']}",
+            f"  Module: {info['file']}",
+        ]
+    if info.get("missing"):
+        return [f"❌ {env_name}: Python not found at {python_path}"]
+    lines = [f"❌ {env_name}: SuperClaude NOT found"]
+    if info.get("err"):
+        lines.append(f"   Error: {info['err']}")
+    return lines
+
+def get_candidates(environments):
+    """Resolve each Python once, dropping empty and duplicate paths
+
+    Returns (env_name, python_path, resolved) tuples, where resolved is None
+    for an interpreter that does not exist.
+    """
+    seen = set()
+    candidates = []
+    for env_name, python_path in environments:
+        if not python_path:
+            continue
+        resolved = resolve_python(python_path)
+        key = resolved or os.path.abspath(python_path)
+        if key in seen:
+            continue
+        seen.add(key)
+        candidates.append((env_name, python_path, resolved))
+    return candidates
+
+def detect(environments, use_cache=True):
+    """Return the first (env_name, python_path) with SuperClaude, or None"""
+    probe = probe_cached if use_cache else probe_superclaude
+    
+    # An explicitly configured interpreter is trusted without scanning the rest
+    env_python = os.environ.get("SUPERCLAUDE_PYTHON")
+    if env_python and probe(resolve_python(env_python)).get("ok"):
+        return "SUPERCLAUDE_PYTHON", env_python
+    
+    for env_name, python_path, resolved in get_candidates(environments):
+        if probe(resolved).get("ok"):
+            return env_name, python_path
+    return None
+
+def report(environments):
+    """Probe every candidate, returning the found count and the report lines"""
+    candidates = get_candidates(environments)
+    
+    # Probe side by side, then format in the original order
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(candidates)))) as executor:
+        results = list(executor.map(lambda c: probe_superclaude(c[2]), candidates))
+    
+    found_count = 0
+    lines = []
+    for (env_name, python_path, _), info in zip(candidates, results):
+        if info.get("ok"):
+            found_count += 1
+        lines.extend(format_superclaude(info, python_path, env_name))
+        lines.append("")
+    return found_count, lines
 
 # Test different Python environments
 environments = [
     ("System Python", "python3"),
-    ("Project venv", os.path.join(os.getcwd(), "venv/bin/python")),
-    ("Project .venv", os.path.join(os.getcwd(), ".venv/bin/python")),
-    ("Parent venv", os.path.join(os.path.dirname(os.getcwd()), "venv/bin/python"))
+    ("Project venv", os.path.join(_CWD, "venv/bin/python")),
+    ("Project .venv", os.path.join(_CWD, ".venv/bin/python")),
+    ("Parent venv", os.path.join(os.path.dirname(_CWD), "venv/bin/python"))
 ]
 
-found_count = 0
-for env_name, python_path in environments:
-    if check_superclaude(python_path, env_name):
-        found_count += 1
-    print()
-
-print(f"\nSummary: SuperClaude found in {found_count} environment(s)")
-
-# Check current process environment
-print("\nCurrent environment:")
-print(f"  VIRTUAL_ENV: {os.environ.get('VIRTUAL_ENV', 'Not set')}")
-print(f"  Python: {sys.executable}")
-
-# Try to import in current Python
-try:
-    import SuperClaude
-    print(f"\n✅ SuperClaude is importable in current Python!")
-    print(f"   Location: {SuperClaude.__file__}")
-except ImportError as e:
-    print(f"\n❌ Cannot import SuperClaude in current Python")
-    print(f"   Error: {e}")
\ No newline at end of file
+if __name__ == "__main__":
+    if "--first-only" in sys.argv[1:]:
+        # Detection only: stop at the first Python that has SuperClaude
+        found = detect(environments, use_cache="--no-cache" not in sys.argv[1:])
+        if found:
+            print(f"✅ {found[0]}: {found[1]}")
+            sys.exit(0)
+        print("❌ SuperClaude not found in any environment")
+        sys.exit(1)
+    
+    found_count, lines = report(environments)
+    
+    # Build the whole report and write it once
+    output = ["=== SuperClaude Installation Verification ===", ""]
+    output.extend(lines)
+    output.append(f"\nSummary: SuperClaude found in {found_count} environment(s)")
+    
+    # Check current process environment
+    output.append("\nCurrent environment:")
+    output.append(f"  VIRTUAL_ENV: {os.environ.get('VIRTUAL_ENV', 'Not set')}")
+    output.append(f"  Python: {sys.executable}")
+    
+    # Try to import in current Python
+    try:
+        import SuperClaude
+        output.append(f"\n✅ SuperClaude is importable in current Python!")
+        output.append(f"   Location: {SuperClaude.__file__}")
+    except ImportError as e:
+        output.append(f"\n❌ Cannot import SuperClaude in current Python")
+        output.append(f"   Error: {e}")
+    
+    sys.stdout.write("\n".join(output) + "\n")